@@ -1,12 +1,25 @@
+import gzip
 import json
+import math
 import os
 import time
+import uuid
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Dict, Any, FrozenSet, List, NamedTuple, Optional, Tuple
 from datetime import datetime, timezone
+from functools import lru_cache
+from operator import itemgetter
 import boto3
 import requests
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library if orjson isn't packaged
+    orjson = None
 # --- Configuration ---
 # Set up basic logging
 LOGGER = logging.getLogger()
@@ -17,20 +30,123 @@ FRED_API_SERIES_UPDATES_PATH: str = '/series/updates'
 # API request parameters
 FRED_API_REQUEST_LIMIT: int = 1000  # Max allowed by FRED API for this endpoint
 FRED_API_FILE_TYPE: str = 'json'
+# Server-side filter for /series/updates: 'macro', 'regional' or 'all'.
+# Regional (state/county/MSA) series make up most of the catalog and are
+# skipped at the API level rather than fetched and filtered here.
+FRED_API_SERIES_FILTER_VALUE: str = 'macro'
+# HTTP connection settings for FRED API requests
+FRED_API_POOL_CONNECTIONS: int = 4
+FRED_API_POOL_MAXSIZE: int = 16
+FRED_API_MAX_RETRIES: int = 5
+FRED_API_RETRY_BACKOFF_FACTOR: float = 0.3
+FRED_API_RETRY_STATUS_CODES: List[int] = [429, 500, 502, 503, 504]
+FRED_API_TIMEOUT_SECONDS: Tuple[float, float] = (3.05, 30)  # (connect, read)
 # Date for considering a series discontinued (YYYY-MM-DD)
 # Series with an observation_end before this date will be skipped.
 SERIES_DISCONTINUED_BEFORE_DATE: str = '2023-01-01'
+# Series with a popularity score (0-100) above this are considered important
+IMPORTANT_POPULARITY_THRESHOLD: int = 50
 # Frequencies considered as "high" indicating importance
-HIGH_UPDATE_FREQUENCIES: List[str] = ['Daily', 'Weekly', 'Monthly']
+HIGH_UPDATE_FREQUENCIES: FrozenSet[str] = frozenset({'Daily', 'Weekly', 'Monthly'})
+# Widely used indicators in economics and finance, always considered important
+IMPORTANT_SERIES_IDS: FrozenSet[str] = frozenset({
+    'GDP',      # Gross Domestic Product
+    'GDPC1',    # Real Gross Domestic Product
+    'UNRATE',   # Unemployment Rate
+    'CPIAUCSL', # Consumer Price Index
+    'FEDFUNDS', # Federal Funds Effective Rate
+    'SP500',    # S&P 500 Index
+    'DGS10',    # 10-Year Treasury Constant Maturity Rate
+    'PAYEMS',   # All Employees: Total Nonfarm
+    'INDPRO',   # Industrial Production Index
+    'PCE',      # Personal Consumption Expenditures
+    'M2',       # M2 Money Stock
+    'HOUST',    # Housing Starts
+    'RSAFS',    # Retail Sales
+    'USREC',    # NBER Recession Indicators
+    'DCOILWTICO', # Crude Oil Prices: WTI
+    'GFDEGDQ188S', # Federal Debt: Total Public Debt as % of GDP
+    'T10Y2Y',   # 10-Year Treasury Minus 2-Year Treasury
+    'USAGDPDEFQISMEI', # GDP Implicit Price Deflator
+    'UMCSENT',  # Consumer Sentiment Index
+    'EXUSEU',   # U.S. / Euro Foreign Exchange Rate
+    'DAAA',     # Moody's Seasoned Aaa Corporate Bond Yield
+    'DBAA',     # Moody's Seasoned Baa Corporate Bond Yield
+    'PCEPI',    # Personal Consumption Expenditures: Chain-type Price Index
+})
+# Fields read by is_important_series, fetched together in a single call
+SERIES_FILTER_FIELDS = itemgetter('id', 'frequency', 'popularity', 'observation_end')
+# Fields kept in the consolidated series index, with their defaults
+SERIES_INDEX_FIELDS: Dict[str, Any] = {
+    'id': '',
+    'title': '',
+    'frequency': '',
+    'units': '',
+    'observation_start': '',
+    'observation_end': '',
+    'last_updated': '',
+    'popularity': 0
+}
 # S3 Configuration - To be set as environment variables
 # S3_BUCKET_NAME: str (e.g., 'my-fred-data-bucket')
 # S3_PREFIX: str (e.g., 'fred_metadata/series_updates')
 # FRED_API_KEY: str (Your FRED API Key)
+# Fan-out Configuration - Only needed when running coordinator_handler
+# FRED_WORKER_FUNCTION_NAME: str (Name or ARN of the function running lambda_handler)
+# The coordinator's role needs lambda:InvokeFunction on the worker function, and
+# the worker's role needs lambda:InvokeFunction on itself to continue after a
+# timeout checkpoint.
+# Storage - Each run stores its files under S3_PREFIX/runs/<run_id>/. Once the series
+# index is written, the previously indexed run is deleted; runs that never complete
+# are not. Add an S3 lifecycle rule on S3_PREFIX/runs/ that expires objects well after
+# the interval between scheduled runs and, with versioning enabled, also expires
+# noncurrent versions, since deleted files otherwise remain as old versions.
 # Lambda Execution Control
 LAMBDA_TIMEOUT_BUFFER_MS: int = 30 * 1000  # 30 seconds buffer before Lambda timeout
 MAX_RUNTIME_SECONDS_BEFORE_CHECKPOINT: int = 13 * 60  # Max runtime ~13 mins to leave buffer for 15 min Lambda
-API_CALLS_PER_RATE_LIMIT_PAUSE: int = 10
-RATE_LIMIT_PAUSE_SECONDS: int = 5
+# Fan-out: maximum number of worker invocations fetching offset ranges in parallel.
+# Workers share the FRED API rate limit evenly.
+FANOUT_MAX_WORKERS: int = 8
+# FRED API rate limit (documented as 120 requests per minute per API key)
+FRED_API_REQUESTS_PER_MINUTE: int = 120
+FRED_API_RATE_LIMIT_BURST: int = 10
+# S3 client connection settings (botocore defaults to a pool of 10)
+S3_MAX_POOL_CONNECTIONS: int = 50
+S3_MAX_ATTEMPTS: int = 5
+# Number of concurrent S3 reads when building the series index (kept below the pool size)
+INDEX_READ_MAX_WORKERS: int = 32
+# Important series from consecutive batches are coalesced into one S3 object
+# until at least this many have accumulated, to cut the number of PUTs
+BATCH_STORE_MIN_SERIES: int = 500
+# gzip level for compressed S3 objects (favor speed; JSON metadata compresses well anyway)
+S3_GZIP_COMPRESS_LEVEL: int = 1
+# --- AWS Clients ---
+# Created once per Lambda container and reused across warm invocations
+S3_CLIENT = boto3.client(
+    's3',
+    config=Config(
+        max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+        tcp_keepalive=True,
+        retries={'mode': 'standard', 'max_attempts': S3_MAX_ATTEMPTS}
+    )
+)
+# Single background worker so a batch upload overlaps the next FRED API request
+S3_UPLOAD_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+# --- HTTP Session ---
+# Shared session so FRED API calls reuse keep-alive connections
+FRED_SESSION = requests.Session()
+FRED_SESSION.mount(
+    'https://',
+    HTTPAdapter(
+        pool_connections=FRED_API_POOL_CONNECTIONS,
+        pool_maxsize=FRED_API_POOL_MAXSIZE,
+        max_retries=Retry(
+            total=FRED_API_MAX_RETRIES,
+            backoff_factor=FRED_API_RETRY_BACKOFF_FACTOR,
+            status_forcelist=FRED_API_RETRY_STATUS_CODES
+        )
+    )
+)
 # --- Helper Functions ---
 def get_env_variable(var_name: str) -> str:
     """Fetches an environment variable or raises an error if not found."""
@@ -39,6 +155,18 @@ def get_env_variable(var_name: str) -> str:
         LOGGER.error(f"Environment variable {var_name} not set.")
         raise ValueError(f"Environment variable {var_name} is required.")
     return value
+def serialize_json(data: Any, pretty: bool = False) -> bytes:
+    """Serializes data to JSON bytes (indented if pretty), using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(data, indent=2).encode('utf-8')
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+def parse_json(raw: bytes) -> Any:
+    """Parses JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 def is_important_series(series_data: Dict[str, Any]) -> bool:
     """
     Determine if a series is important based on available criteria from /series/updates.
@@ -54,54 +182,81 @@ def is_important_series(series_data: Dict[str, Any]) -> bool:
     - Popularity: The 'popularity' field (0-100) is available and could be
       used as an additional filter if a suitable threshold is defined.
     """
-    # Skip discontinued series
-    observation_end = series_data.get('observation_end')
-    if observation_end and observation_end < SERIES_DISCONTINUED_BEFORE_DATE:
+    # Fetch all four fields in one C-level call; fall back to .get() for
+    # the rare record missing one of them
+    try:
+        series_id, frequency, popularity, observation_end = SERIES_FILTER_FIELDS(series_data)
+    except KeyError:
+        get = series_data.get
+        series_id, frequency, popularity, observation_end = (
+            get('id'), get('frequency'), get('popularity'), get('observation_end')
+        )
+    
+    # Cheap set lookups first: important by ID, or a high frequency of
+    # updates (indicates actively used series). Failing those, check if it's a
+    # popular series: FRED provides a popularity score (0-100) indicating
+    # relative importance; the field may be present but null.
+    if not (series_id in IMPORTANT_SERIES_IDS or
+            frequency in HIGH_UPDATE_FREQUENCIES or
+            (popularity or 0) > IMPORTANT_POPULARITY_THRESHOLD):
         return False
     
-    # Check if it's a popular series
-    # FRED provides a popularity score (0-100) indicating relative importance
-    popularity = series_data.get('popularity', 0)
-    if popularity > 50:  # Consider series with popularity > 50 as important
-        return True
-    
-    # Check if it has a high frequency of updates (indicates actively used series)
-    frequency = series_data.get('frequency')
-    if frequency in HIGH_UPDATE_FREQUENCIES:
-        return True
-    
-    # Check for important series by ID
-    # List of widely used indicators in economics and finance
-    IMPORTANT_SERIES_IDS = [
-        'GDP',      # Gross Domestic Product
-        'GDPC1',    # Real Gross Domestic Product
-        'UNRATE',   # Unemployment Rate
-        'CPIAUCSL', # Consumer Price Index
-        'FEDFUNDS', # Federal Funds Effective Rate
-        'SP500',    # S&P 500 Index
-        'DGS10',    # 10-Year Treasury Constant Maturity Rate
-        'PAYEMS',   # All Employees: Total Nonfarm
-        'INDPRO',   # Industrial Production Index
-        'PCE',      # Personal Consumption Expenditures
-        'M2',       # M2 Money Stock
-        'HOUST',    # Housing Starts
-        'RSAFS',    # Retail Sales
-        'USREC',    # NBER Recession Indicators
-        'DCOILWTICO', # Crude Oil Prices: WTI
-        'GFDEGDQ188S', # Federal Debt: Total Public Debt as % of GDP
-        'T10Y2Y',   # 10-Year Treasury Minus 2-Year Treasury
-        'USAGDPDEFQISMEI', # GDP Implicit Price Deflator
-        'UMCSENT',  # Consumer Sentiment Index
-        'EXUSEU',   # U.S. / Euro Foreign Exchange Rate
-        'DAAA',     # Moody's Seasoned Aaa Corporate Bond Yield
-        'DBAA',     # Moody's Seasoned Baa Corporate Bond Yield
-        'PCEPI',    # Personal Consumption Expenditures: Chain-type Price Index
-    ]
-    
-    if series_data.get('id') in IMPORTANT_SERIES_IDS:
-        return True
-        
-    return False
+    # Skip discontinued series
+    return not (observation_end and observation_end < SERIES_DISCONTINUED_BEFORE_DATE)
+
+def build_index_entry(series_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Project a series down to the fields stored in the consolidated index.
+    Args:
+        series_data: A dictionary representing a single series from FRED API.
+    Returns:
+        Dictionary containing only the SERIES_INDEX_FIELDS.
+    """
+    return {
+        field: series_data.get(field, default)
+        for field, default in SERIES_INDEX_FIELDS.items()
+    }
+
+class TokenBucket:
+    """
+    Token bucket rate limiter that only sleeps as long as needed to stay
+    within the configured request rate.
+    """
+    def __init__(self, rate_per_second: float, capacity: int):
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+    
+    def configure(self, rate_per_second: float, capacity: int) -> None:
+        """Change the rate and burst size, dropping any tokens above the new capacity."""
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self.tokens = min(self.tokens, float(capacity))
+    
+    def acquire(self) -> None:
+        """Take one token, waiting for the bucket to refill if it is empty."""
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity,
+            self.tokens + (now - self.last_refill) * self.rate_per_second
+        )
+        self.last_refill = now
+        
+        if self.tokens < 1:
+            wait_seconds = (1 - self.tokens) / self.rate_per_second
+            LOGGER.info(f"Rate limit reached, waiting {wait_seconds:.2f}s")
+            time.sleep(wait_seconds)
+            self.tokens = 1.0
+            self.last_refill = time.monotonic()
+        
+        self.tokens -= 1
+
+# Shared across warm invocations since the FRED limit applies per API key
+FRED_RATE_LIMITER = TokenBucket(
+    rate_per_second=FRED_API_REQUESTS_PER_MINUTE / 60,
+    capacity=FRED_API_RATE_LIMIT_BURST
+)
 
 def make_fred_api_request(
     endpoint_path: str, 
@@ -110,6 +265,9 @@ def make_fred_api_request(
     """
     Makes a request to the FRED API.
     
+    Requests are paced by FRED_RATE_LIMITER; HTTP 429 responses are retried
+    by the session adapter, honoring any Retry-After header.
+    
     Args:
         endpoint_path: The API endpoint path (e.g., '/series/updates')
         params: Dictionary of query parameters
@@ -123,15 +281,18 @@ def make_fred_api_request(
     url = f"{FRED_API_ENDPOINT_BASE}{endpoint_path}"
     LOGGER.info(f"Making request to {url} with params: {params}")
     
-    response = requests.get(url, params=params)
+    FRED_RATE_LIMITER.acquire()
+    response = FRED_SESSION.get(url, params=params, timeout=FRED_API_TIMEOUT_SECONDS)
     response.raise_for_status()  # Raise exception for HTTP errors
     
-    return response.json()
+    return parse_json(response.content)
 
 def store_data_in_s3(
     bucket: str, 
     key: str, 
-    data: Dict[str, Any]
+    data: Dict[str, Any],
+    pretty: bool = False,
+    compress: bool = False
 ) -> None:
     """
     Store JSON data in an S3 bucket.
@@ -140,23 +301,313 @@ def store_data_in_s3(
         bucket: S3 bucket name
         key: S3 object key
         data: Data to store (will be converted to JSON)
+        pretty: Whether to indent the JSON for human readers
+        compress: Whether to gzip the body (stored with Content-Encoding: gzip)
         
     Raises:
         botocore.exceptions.ClientError: For S3-related errors
     """
     try:
-        s3_client = boto3.client('s3')
-        s3_client.put_object(
+        body = serialize_json(data, pretty=pretty)
+        extra_args = {}
+        if compress:
+            body = gzip.compress(body, compresslevel=S3_GZIP_COMPRESS_LEVEL)
+            extra_args['ContentEncoding'] = 'gzip'
+        
+        S3_CLIENT.put_object(
             Bucket=bucket,
             Key=key,
-            Body=json.dumps(data, indent=2),
-            ContentType='application/json'
+            Body=body,
+            ContentType='application/json',
+            **extra_args
         )
         LOGGER.info(f"Successfully stored data at s3://{bucket}/{key}")
     except ClientError as e:
         LOGGER.error(f"Error storing data in S3: {str(e)}")
         raise
 
+def read_data_from_s3(
+    bucket: str,
+    key: str
+) -> Dict[str, Any]:
+    """
+    Read JSON data from an S3 bucket, decompressing gzip-encoded objects.
+    
+    Args:
+        bucket: S3 bucket name
+        key: S3 object key
+        
+    Returns:
+        Parsed JSON data
+        
+    Raises:
+        botocore.exceptions.ClientError: For S3-related errors
+    """
+    response = S3_CLIENT.get_object(Bucket=bucket, Key=key)
+    body = response['Body'].read()
+    # boto3 does not decode Content-Encoding, so decompress here
+    if response.get('ContentEncoding') == 'gzip':
+        body = gzip.decompress(body)
+    return parse_json(body)
+
+def list_batch_keys(
+    bucket: str,
+    prefix: str
+) -> Dict[int, str]:
+    """
+    List the batch objects actually present in S3.
+    
+    Args:
+        bucket: S3 bucket name
+        prefix: S3 prefix for stored data
+        
+    Returns:
+        Dictionary mapping batch number to S3 object key
+        
+    Raises:
+        botocore.exceptions.ClientError: For S3-related errors
+    """
+    batches_prefix = f"{prefix}/batches/"
+    batch_keys = {}
+    
+    paginator = S3_CLIENT.get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=bucket, Prefix=batches_prefix):
+        for obj in page.get('Contents', []):
+            key = obj['Key']
+            name = key[len(batches_prefix):]
+            if not (name.startswith('batch_') and name.endswith('.json')):
+                continue
+            batch_num = name[len('batch_'):-len('.json')]
+            if batch_num.isdigit():
+                batch_keys[int(batch_num)] = key
+    
+    return batch_keys
+
+def store_series_batch(
+    bucket: str,
+    prefix: str,
+    batch_number: int,
+    series: List[Dict[str, Any]]
+) -> None:
+    """
+    Store important series as a compressed batch file.
+    
+    Args:
+        bucket: S3 bucket name
+        prefix: S3 prefix for stored data
+        batch_number: Number of the first batch the series were fetched in
+        series: Important series to store
+        
+    Raises:
+        botocore.exceptions.ClientError: For S3-related errors
+    """
+    store_data_in_s3(
+        bucket=bucket,
+        key=f"{prefix}/batches/batch_{batch_number}.json",
+        data={
+            'count': len(series),
+            'series': series
+        },
+        compress=True
+    )
+
+def count_objects(
+    bucket: str,
+    prefix: str
+) -> int:
+    """
+    Count the S3 objects under a prefix.
+    
+    Args:
+        bucket: S3 bucket name
+        prefix: S3 prefix to count
+        
+    Returns:
+        Number of objects under the prefix
+    """
+    paginator = S3_CLIENT.get_paginator('list_objects_v2')
+    return sum(
+        page.get('KeyCount', 0)
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix)
+    )
+
+def delete_objects(
+    bucket: str,
+    prefix: str
+) -> int:
+    """
+    Delete every S3 object under a prefix.
+    
+    Args:
+        bucket: S3 bucket name
+        prefix: S3 prefix to delete
+        
+    Returns:
+        Number of objects deleted
+    """
+    deleted = 0
+    paginator = S3_CLIENT.get_paginator('list_objects_v2')
+    
+    # A listing page holds at most 1000 keys, the most one request can delete
+    for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+        keys = [{'Key': obj['Key']} for obj in page.get('Contents', [])]
+        if not keys:
+            continue
+        
+        response = S3_CLIENT.delete_objects(
+            Bucket=bucket,
+            Delete={'Objects': keys, 'Quiet': True}
+        )
+        errors = response.get('Errors', [])
+        for error in errors:
+            LOGGER.warning(f"Could not delete {error.get('Key')}: {error.get('Message')}")
+        deleted += len(keys) - len(errors)
+    
+    return deleted
+
+@lru_cache(maxsize=None)
+def get_lambda_client() -> Any:
+    """
+    Returns the Lambda client, created on first use.
+    
+    Unlike S3, the Lambda client needs a region at construction time, so it is
+    not created at import where it would break runs without one configured.
+    """
+    return boto3.client('lambda')
+
+def invoke_async(
+    function_name: str,
+    payload: Dict[str, Any]
+) -> None:
+    """
+    Invoke a Lambda function asynchronously (fire and forget).
+    
+    Args:
+        function_name: Name or ARN of the function to invoke
+        payload: Event passed to the function
+        
+    Raises:
+        botocore.exceptions.ClientError: For Lambda-related errors
+    """
+    get_lambda_client().invoke(
+        FunctionName=function_name,
+        InvocationType='Event',
+        Payload=json.dumps(payload).encode('utf-8')
+    )
+
+class FetchProgress(NamedTuple):
+    """Position of a fetch run, as recorded in its checkpoints."""
+    offset: int
+    total_fetched: int
+    important_count: int
+    batch_number: int
+
+class SeriesBatchBuffer:
+    """
+    Buffers important series into batch files of at least BATCH_STORE_MIN_SERIES
+    and stores full ones on S3_UPLOAD_EXECUTOR while the next batch is fetched.
+    
+    Each batch file remembers the progress from before its first series was
+    fetched; that is where fetching resumes if the file fails to store.
+    """
+    
+    def __init__(self, bucket: str, prefix: str):
+        self.bucket = bucket
+        self.prefix = prefix
+        self.pending_store: Optional[Future] = None
+        self.pending_progress: Optional[FetchProgress] = None
+        self.series: List[Dict[str, Any]] = []
+        self.progress: Optional[FetchProgress] = None
+    
+    def add(self, series: List[Dict[str, Any]], progress: FetchProgress) -> None:
+        """
+        Buffer the important series of a batch, starting a background store
+        once enough have accumulated. Callers wait() for the previous store first.
+        
+        Args:
+            series: Important series of the batch
+            progress: Progress from before the batch was fetched
+        """
+        if not self.series:
+            self.progress = progress
+        self.series.extend(series)
+        
+        if len(self.series) >= BATCH_STORE_MIN_SERIES:
+            self.pending_store = S3_UPLOAD_EXECUTOR.submit(
+                store_series_batch,
+                self.bucket, self.prefix, self.progress.batch_number, self.series
+            )
+            self.pending_progress = self.progress
+            self.series = []
+    
+    def wait(self) -> Optional[FetchProgress]:
+        """
+        Wait for the background store, if one is running.
+        
+        Returns:
+            Progress to resume from if the store failed, None otherwise. Buffered
+            series are dropped on failure since they will be fetched again.
+        """
+        pending_store, self.pending_store = self.pending_store, None
+        if pending_store is None:
+            return None
+        
+        try:
+            pending_store.result()
+            return None
+        except Exception as e:
+            LOGGER.error(f"Failed to store batch {self.pending_progress.batch_number}: {str(e)}")
+            self.series = []
+            return self.pending_progress
+    
+    def flush(self) -> Optional[FetchProgress]:
+        """
+        Make sure every buffered series is in S3 before checkpointing.
+        
+        Returns:
+            Progress to resume from if anything failed to store, None otherwise
+        """
+        rollback_progress = self.wait()
+        if rollback_progress or not self.series:
+            return rollback_progress
+        
+        series, self.series = self.series, []
+        try:
+            store_series_batch(self.bucket, self.prefix, self.progress.batch_number, series)
+            return None
+        except Exception as e:
+            LOGGER.error(f"Failed to store batch {self.progress.batch_number}: {str(e)}")
+            return self.progress
+
+def load_checkpoint(
+    bucket: str,
+    prefix: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Load the checkpoint stored under a prefix, if there is one.
+    
+    Args:
+        bucket: S3 bucket name
+        prefix: S3 prefix the checkpoint was stored under
+        
+    Returns:
+        Checkpoint data dictionary, or None if no checkpoint exists
+        
+    Raises:
+        botocore.exceptions.ClientError: For S3-related errors other than a missing key
+    """
+    try:
+        return read_data_from_s3(bucket, f"{prefix}/checkpoint.json")
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') == 'NoSuchKey':
+            return None
+        raise
+
+def generate_run_id() -> str:
+    """Returns a new run ID; each run stores its batches under runs/<run_id>/."""
+    # Random suffix so runs started within the same second never share a prefix
+    return f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}-{uuid.uuid4().hex[:8]}"
+
 def create_checkpoint(
     bucket: str,
     prefix: str,
@@ -165,11 +616,15 @@ def create_checkpoint(
     important_count: int,
     batch_number: int,
     execution_complete: bool = False,
-    error: Optional[str] = None
+    error: Optional[str] = None,
+    run_id: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Create and store a checkpoint in S3 for resuming execution.
     
+    Only the current checkpoint.json is written. Checkpoint history is kept by
+    enabling S3 Object Versioning on the bucket (see list_object_versions).
+    
     Args:
         bucket: S3 bucket name
         prefix: S3 prefix for storing checkpoint data
@@ -179,6 +634,7 @@ def create_checkpoint(
         batch_number: Current batch number
         execution_complete: Whether execution is complete
         error: Optional error message
+        run_id: ID of the run whose batches the checkpoint refers to
         
     Returns:
         Checkpoint data dictionary
@@ -197,20 +653,16 @@ def create_checkpoint(
     if error:
         checkpoint['error'] = error
     
+    if run_id:
+        checkpoint['run_id'] = run_id
+    
     try:
         store_data_in_s3(
             bucket=bucket,
             key=f"{prefix}/checkpoint.json",
-            data=checkpoint
-        )
-        
-        # Also create a timestamped checkpoint for history
-        store_data_in_s3(
-            bucket=bucket,
-            key=f"{prefix}/checkpoints/checkpoint_{timestamp.replace(':', '-')}.json",
-            data=checkpoint
+            data=checkpoint,
+            pretty=True
         )
-        
     except Exception as e:
         LOGGER.error(f"Failed to store checkpoint: {str(e)}")
     
@@ -223,6 +675,13 @@ def fetch_fred_series_metadata(
     """
     Main function to fetch and store important FRED series metadata.
     
+    When invoked as a fan-out worker (see coordinate_fred_series_fetch) the
+    event carries 'offset_range', 'run_id' and 'worker_count'; the worker only
+    fetches its range, re-invokes itself to continue after a timeout
+    checkpoint, and the last worker to finish builds the series index. On an
+    error the worker raises after checkpointing so Lambda's asynchronous
+    retries apply; a retry resumes from the worker's stored checkpoint.
+    
     Args:
         event: Lambda event data, may contain checkpoint info for resuming
         context: Lambda context
@@ -243,22 +702,78 @@ def fetch_fred_series_metadata(
     
     # Initialize tracking variables
     start_time = time.time()
-    current_offset = 0
-    total_series_fetched = 0
-    important_series_count = 0
-    batch_number = 0
-    api_calls_count = 0
+    progress = FetchProgress(offset=0, total_fetched=0, important_count=0, batch_number=0)
+    index_entries: List[Dict[str, Any]] = []
+    
+    # Fan-out workers only fetch their assigned offset range
+    worker_range = event.get('offset_range') if isinstance(event, dict) else None
+    end_offset: Optional[int] = None
+    checkpoint_prefix = s3_prefix
+    batch_prefix = s3_prefix
+    run_id: Optional[str] = None
+    worker_count = 1
+    
+    if worker_range:
+        progress = progress._replace(
+            offset=worker_range['start'],
+            batch_number=worker_range['start'] // FRED_API_REQUEST_LIMIT
+        )
+        end_offset = worker_range.get('end')
+        worker_count = event.get('worker_count', 1)
+        run_id = event['run_id']
+        run_prefix = f"{s3_prefix}/runs/{run_id}"
+        checkpoint_prefix = f"{run_prefix}/workers/offset_{worker_range['start']}"
+        
+        LOGGER.info(f"Running as fan-out worker for offsets {progress.offset} to "
+                    f"{end_offset if end_offset is not None else 'end'}")
+    
+    # Parallel workers split the per-key FRED rate limit between them
+    FRED_RATE_LIMITER.configure(
+        rate_per_second=FRED_API_REQUESTS_PER_MINUTE / 60 / worker_count,
+        capacity=max(1, FRED_API_RATE_LIMIT_BURST // worker_count)
+    )
+    
+    resume_checkpoint = event.get('checkpoint') if isinstance(event, dict) else None
+    
+    # Asynchronous retries re-deliver the triggering event, whose checkpoint
+    # may predate batches stored by the failed attempt, so workers resume from
+    # their stored checkpoint. The event's checkpoint is only used when nothing
+    # is stored or storing it failed (checkpoint timestamps share one format).
+    if worker_range:
+        stored_checkpoint = load_checkpoint(s3_bucket, checkpoint_prefix)
+        if stored_checkpoint and (
+            not resume_checkpoint
+            or stored_checkpoint.get('timestamp', '') >= resume_checkpoint.get('timestamp', '')
+        ):
+            resume_checkpoint = stored_checkpoint
     
     # Check if this is a continuation from a previous execution
-    if isinstance(event, dict) and event.get('checkpoint'):
-        checkpoint = event.get('checkpoint', {})
-        current_offset = checkpoint.get('offset', 0)
-        total_series_fetched = checkpoint.get('total_fetched', 0)
-        important_series_count = checkpoint.get('important_count', 0)
-        batch_number = checkpoint.get('batch_number', 0)
+    if resume_checkpoint:
+        checkpoint = resume_checkpoint
+        progress = FetchProgress(
+            offset=checkpoint.get('offset', 0),
+            total_fetched=checkpoint.get('total_fetched', 0),
+            important_count=checkpoint.get('important_count', 0),
+            batch_number=checkpoint.get('batch_number', 0)
+        )
+        run_id = checkpoint.get('run_id', run_id)
         
-        LOGGER.info(f"Resuming execution from checkpoint: offset={current_offset}, "
-                    f"batch={batch_number}, total_fetched={total_series_fetched}")
+        LOGGER.info(f"Resuming execution from checkpoint: offset={progress.offset}, "
+                    f"batch={progress.batch_number}, total_fetched={progress.total_fetched}")
+    elif not worker_range:
+        run_id = generate_run_id()
+    
+    # Batches are scoped to the run so the index never picks up files left by
+    # earlier runs. Checkpoints written before run IDs existed keep using the
+    # shared batches/ location.
+    if run_id:
+        batch_prefix = f"{s3_prefix}/runs/{run_id}"
+    else:
+        LOGGER.warning("Checkpoint has no run_id, storing batches under the shared prefix")
+    
+    # Index entries are only collected for batches fetched by this execution
+    first_batch_number = progress.batch_number
+    batches = SeriesBatchBuffer(s3_bucket, batch_prefix)
     
     # Main execution loop
     keep_fetching = True
@@ -277,15 +792,28 @@ def fetch_fred_series_metadata(
            (elapsed_seconds > MAX_RUNTIME_SECONDS_BEFORE_CHECKPOINT):
             LOGGER.info(f"Approaching timeout. Creating checkpoint after {elapsed_seconds:.2f}s")
             
+            progress = batches.flush() or progress
+            
             checkpoint = create_checkpoint(
                 bucket=s3_bucket,
-                prefix=s3_prefix,
-                offset=current_offset,
-                total_fetched=total_series_fetched,
-                important_count=important_series_count,
-                batch_number=batch_number
+                prefix=checkpoint_prefix,
+                offset=progress.offset,
+                total_fetched=progress.total_fetched,
+                important_count=progress.important_count,
+                batch_number=progress.batch_number,
+                run_id=run_id
             )
             
+            # Nothing orchestrates fan-out workers, so continue from the checkpoint
+            if worker_range:
+                try:
+                    invoke_async(
+                        context.invoked_function_arn,
+                        {**event, 'checkpoint': checkpoint}
+                    )
+                except Exception as e:
+                    LOGGER.error(f"Failed to re-invoke worker: {str(e)}")
+            
             return {
                 'statusCode': 200,
                 'body': json.dumps({
@@ -296,77 +824,98 @@ def fetch_fred_series_metadata(
             }
         
         try:
-            # Make API request to fetch series batch
-            api_calls_count += 1
-            api_params = {
-                'api_key': fred_api_key,
-                'file_type': FRED_API_FILE_TYPE,
-                'limit': FRED_API_REQUEST_LIMIT,
-                'offset': current_offset
-            }
+            if end_offset is not None and progress.offset >= end_offset:
+                LOGGER.info(f"Reached end of assigned offset range ({end_offset})")
+                series_batch = []
+            else:
+                # Make API request to fetch series batch
+                api_params = {
+                    'api_key': fred_api_key,
+                    'file_type': FRED_API_FILE_TYPE,
+                    'filter_value': FRED_API_SERIES_FILTER_VALUE,
+                    'limit': FRED_API_REQUEST_LIMIT,
+                    'offset': progress.offset
+                }
+                
+                LOGGER.info(f"Fetching batch {progress.batch_number} (offset: {progress.offset})")
+                response_data = make_fred_api_request(
+                    endpoint_path=FRED_API_SERIES_UPDATES_PATH,
+                    params=api_params
+                )
+                series_batch = response_data.get('seriess', [])
             
-            LOGGER.info(f"Fetching batch {batch_number} (offset: {current_offset})")
-            response_data = make_fred_api_request(
-                endpoint_path=FRED_API_SERIES_UPDATES_PATH,
-                params=api_params
-            )
+            # The previous upload must succeed before its progress is relied on
+            rollback_progress = batches.wait()
+            if rollback_progress:
+                progress = rollback_progress
+                raise RuntimeError(f"Failed to store batch {progress.batch_number}")
             
             # Process the batch of series
-            series_batch = response_data.get('seriess', [])
             batch_count = len(series_batch)
             
             if batch_count == 0:
                 LOGGER.info("No more series found. Completing execution.")
                 keep_fetching = False
+                
+                # Store whatever is still buffered
+                rollback_progress = batches.flush()
+                if rollback_progress:
+                    progress = rollback_progress
+                    raise RuntimeError(f"Failed to store batch {progress.batch_number}")
             else:
                 # Filter for important series
-                batch_important_series = []
-                for series in series_batch:
-                    if is_important_series(series):
-                        batch_important_series.append(series)
+                batch_important_series = [
+                    series for series in series_batch if is_important_series(series)
+                ]
                 
                 batch_important_count = len(batch_important_series)
-                important_series_count += batch_important_count
                 
-                LOGGER.info(f"Batch {batch_number}: Found {batch_important_count} "
+                LOGGER.info(f"Batch {progress.batch_number}: Found {batch_important_count} "
                            f"important series out of {batch_count}")
                 
-                # Store the batch of important series
+                # Buffer the important series; once enough have accumulated,
+                # store them in the background while the next batch is requested
                 if batch_important_series:
-                    store_data_in_s3(
-                        bucket=s3_bucket,
-                        key=f"{s3_prefix}/batches/batch_{batch_number}.json",
-                        data={
-                            'count': batch_important_count,
-                            'series': batch_important_series
-                        }
-                    )
+                    batches.add(batch_important_series, progress)
+                    
+                    # Workers rebuild the index from S3 at fan-in instead
+                    if not worker_range:
+                        index_entries.extend(
+                            build_index_entry(series) for series in batch_important_series
+                        )
                 
                 # Update tracking variables
-                total_series_fetched += batch_count
-                current_offset += FRED_API_REQUEST_LIMIT
-                batch_number += 1
-                
-                # Add delay to respect API rate limits
-                if api_calls_count % API_CALLS_PER_RATE_LIMIT_PAUSE == 0:
-                    LOGGER.info(f"Pausing for {RATE_LIMIT_PAUSE_SECONDS}s to respect API rate limits")
-                    time.sleep(RATE_LIMIT_PAUSE_SECONDS)
+                progress = FetchProgress(
+                    offset=progress.offset + FRED_API_REQUEST_LIMIT,
+                    total_fetched=progress.total_fetched + batch_count,
+                    important_count=progress.important_count + batch_important_count,
+                    batch_number=progress.batch_number + 1
+                )
                 
         except Exception as e:
-            error_msg = f"Error in batch {batch_number}: {str(e)}"
+            # Store everything fetched so far so the checkpoint is accurate
+            progress = batches.flush() or progress
+            
+            error_msg = f"Error in batch {progress.batch_number}: {str(e)}"
             LOGGER.error(error_msg)
             
             # Create error checkpoint
             checkpoint = create_checkpoint(
                 bucket=s3_bucket,
-                prefix=s3_prefix,
-                offset=current_offset,
-                total_fetched=total_series_fetched,
-                important_count=important_series_count,
-                batch_number=batch_number,
-                error=error_msg
+                prefix=checkpoint_prefix,
+                offset=progress.offset,
+                total_fetched=progress.total_fetched,
+                important_count=progress.important_count,
+                batch_number=progress.batch_number,
+                error=error_msg,
+                run_id=run_id
             )
             
+            # Nothing reads a fan-out worker's response; fail the invocation so
+            # Lambda retries it from the checkpoint just stored
+            if worker_range:
+                raise
+            
             return {
                 'statusCode': 500,
                 'body': json.dumps({
@@ -382,79 +931,240 @@ def fetch_fred_series_metadata(
     # Create final checkpoint and metadata summary
     checkpoint = create_checkpoint(
         bucket=s3_bucket,
-        prefix=s3_prefix,
-        offset=current_offset,
-        total_fetched=total_series_fetched,
-        important_count=important_series_count,
-        batch_number=batch_number,
-        execution_complete=True
+        prefix=checkpoint_prefix,
+        offset=progress.offset,
+        total_fetched=progress.total_fetched,
+        important_count=progress.important_count,
+        batch_number=progress.batch_number,
+        execution_complete=True,
+        run_id=run_id
     )
     
     # Create index of important series for easier access
+    index_run_id: Optional[str] = None
     try:
-        create_series_index(s3_bucket, s3_prefix, batch_number)
+        if worker_range:
+            # Fan-in: record completion; the last worker to finish rebuilds the
+            # index from all batches stored by this run
+            store_data_in_s3(
+                bucket=s3_bucket,
+                key=f"{run_prefix}/completed/offset_{worker_range['start']}.json",
+                data=checkpoint
+            )
+            completed_workers = count_objects(s3_bucket, f"{run_prefix}/completed/")
+            if completed_workers >= worker_count:
+                create_series_index(s3_bucket, s3_prefix, run_prefix)
+                index_run_id = run_id
+            else:
+                LOGGER.info(f"{completed_workers} of {worker_count} workers complete, "
+                            f"leaving the index to the last worker")
+        else:
+            create_series_index(
+                s3_bucket,
+                s3_prefix,
+                batch_prefix,
+                collected_entries=index_entries,
+                collected_from_batch=first_batch_number
+            )
+            index_run_id = run_id
     except Exception as e:
         LOGGER.error(f"Failed to create series index: {str(e)}")
     
+    # Only drop the previous run's files once an index of this run exists
+    if index_run_id:
+        try:
+            replace_indexed_run(s3_bucket, s3_prefix, index_run_id)
+        except Exception as e:
+            LOGGER.error(f"Failed to delete the previously indexed run: {str(e)}")
+    
     return {
         'statusCode': 200,
         'body': json.dumps({
             'message': 'Successfully completed FRED series metadata collection',
-            'total_series_processed': total_series_fetched,
-            'important_series_saved': important_series_count,
+            'total_series_processed': progress.total_fetched,
+            'important_series_saved': progress.important_count,
             'execution_time_seconds': execution_time,
             'checkpoint': checkpoint
         }),
         'checkpoint': checkpoint
     }
 
+def coordinate_fred_series_fetch(
+    event: Dict[str, Any],
+    context: Any
+) -> Dict[str, Any]:
+    """
+    Split the series scan into offset ranges and fan them out to workers.
+    
+    Reads the total series count with a single small request, then invokes
+    the worker function asynchronously once per range. The last range is
+    left open-ended so series added since the count are still picked up.
+    
+    Every worker event carries the number of ranges planned for the run, so
+    fan-in only completes once all of them have run. Events that could not be
+    invoked are returned as 'failed_worker_events'; invoking the coordinator
+    with them as 'worker_events' re-sends just those under the same run.
+    
+    Args:
+        event: Lambda event data, may contain 'worker_events' to re-send
+        context: Lambda context
+        
+    Returns:
+        Dictionary with the fan-out summary
+    """
+    try:
+        fred_api_key = get_env_variable('FRED_API_KEY')
+        worker_function = get_env_variable('FRED_WORKER_FUNCTION_NAME')
+    except ValueError as e:
+        return {
+            'statusCode': 500,
+            'body': json.dumps({'error': str(e)})
+        }
+    
+    worker_events = event.get('worker_events') if isinstance(event, dict) else None
+    
+    try:
+        if worker_events:
+            run_id = worker_events[0]['run_id']
+            total_count = None
+            LOGGER.info(f"Re-sending {len(worker_events)} worker events (run {run_id})")
+        else:
+            response_data = make_fred_api_request(
+                endpoint_path=FRED_API_SERIES_UPDATES_PATH,
+                params={
+                    'api_key': fred_api_key,
+                    'file_type': FRED_API_FILE_TYPE,
+                    'filter_value': FRED_API_SERIES_FILTER_VALUE,
+                    'limit': 1
+                }
+            )
+            total_count = int(response_data.get('count', 0))
+            
+            total_batches = math.ceil(total_count / FRED_API_REQUEST_LIMIT)
+            worker_count = min(FANOUT_MAX_WORKERS, total_batches)
+            run_id = generate_run_id()
+            worker_events = []
+            
+            if worker_count:
+                range_size = math.ceil(total_batches / worker_count) * FRED_API_REQUEST_LIMIT
+                worker_count = math.ceil(total_count / range_size)
+                
+                for start in range(0, total_count, range_size):
+                    end = start + range_size
+                    worker_events.append({
+                        'run_id': run_id,
+                        'worker_count': worker_count,
+                        'offset_range': {
+                            'start': start,
+                            'end': end if end < total_count else None
+                        }
+                    })
+    except Exception as e:
+        error_msg = f"Error fanning out series fetch: {str(e)}"
+        LOGGER.error(error_msg)
+        return {
+            'statusCode': 500,
+            'body': json.dumps({'error': error_msg})
+        }
+    
+    # Keep dispatching past a failed invoke so only the failed ranges need re-sending
+    failed_worker_events = []
+    for worker_event in worker_events:
+        try:
+            invoke_async(worker_function, worker_event)
+        except Exception as e:
+            LOGGER.error(f"Failed to invoke worker for offsets starting at "
+                         f"{worker_event['offset_range']['start']}: {str(e)}")
+            failed_worker_events.append(worker_event)
+    
+    dispatched = len(worker_events) - len(failed_worker_events)
+    LOGGER.info(f"Fanned out {total_count if total_count is not None else 'remaining'} "
+                f"series to {dispatched} of {len(worker_events)} workers (run {run_id})")
+    
+    if failed_worker_events:
+        return {
+            'statusCode': 500,
+            'body': json.dumps({
+                'error': f"Failed to invoke {len(failed_worker_events)} workers; "
+                         f"re-send them as 'worker_events' to complete the run",
+                'run_id': run_id,
+                'failed_worker_events': failed_worker_events
+            })
+        }
+    
+    return {
+        'statusCode': 200,
+        'body': json.dumps({
+            'message': 'Fanned out FRED series metadata collection',
+            'run_id': run_id,
+            'total_series': total_count,
+            'worker_count': worker_events[0]['worker_count'] if worker_events else 0,
+            'workers_invoked': len(worker_events)
+        })
+    }
+
 def create_series_index(
     bucket: str,
     prefix: str,
-    total_batches: int
+    batch_prefix: str,
+    collected_entries: Optional[List[Dict[str, Any]]] = None,
+    collected_from_batch: int = 0
 ) -> None:
     """
     Create a consolidated index of all important series.
     
+    Index entries gathered while fetching are used as-is; only batches stored
+    by earlier executions are read back from S3.
+    
     Args:
         bucket: S3 bucket name
-        prefix: S3 prefix for stored data
-        total_batches: Total number of batches to process
+        prefix: S3 prefix the index is written under
+        batch_prefix: S3 prefix of the run whose batches are indexed
+        collected_entries: Index entries built during the current execution,
+            or None to rebuild the whole index from the run's stored batches
+        collected_from_batch: First batch number covered by collected_entries
     """
-    LOGGER.info(f"Creating consolidated index from {total_batches} batches")
-    
-    s3_client = boto3.client('s3')
-    all_series = []
+    series_index = []
     
-    # Read all batches
-    for batch_num in range(total_batches):
-        try:
-            response = s3_client.get_object(
-                Bucket=bucket,
-                Key=f"{prefix}/batches/batch_{batch_num}.json"
-            )
+    if collected_entries is None or collected_from_batch > 0:
+        # Only batches that yielded important series are written, and resumed
+        # runs may leave gaps, so discover the batch objects instead of guessing
+        batch_keys = list_batch_keys(bucket, batch_prefix)
+        if collected_entries is not None:
+            batch_keys = {
+                batch_num: key for batch_num, key in batch_keys.items()
+                if batch_num < collected_from_batch
+            }
+        
+        LOGGER.info(f"Reading {len(batch_keys)} stored batches for the index")
+        
+        batch_series: Dict[int, List[Dict[str, Any]]] = {}
+        
+        # Read all batches concurrently; S3 GETs are I/O bound
+        with ThreadPoolExecutor(max_workers=INDEX_READ_MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(read_data_from_s3, bucket, key): batch_num
+                for batch_num, key in batch_keys.items()
+            }
             
-            batch_data = json.loads(response['Body'].read().decode('utf-8'))
-            all_series.extend(batch_data.get('series', []))
-        except Exception as e:
-            LOGGER.warning(f"Could not read batch {batch_num}: {str(e)}")
+            for future in as_completed(futures):
+                batch_num = futures[future]
+                try:
+                    batch_series[batch_num] = future.result().get('series', [])
+                except Exception as e:
+                    LOGGER.warning(f"Could not read batch {batch_num}: {str(e)}")
+        
+        # Combine in batch order so the index is deterministic
+        for batch_num in sorted(batch_series):
+            series_index.extend(
+                build_index_entry(series) for series in batch_series[batch_num]
+            )
     
-    # Create simplified index
-    series_index = []
-    for series in all_series:
-        series_index.append({
-            'id': series.get('id', ''),
-            'title': series.get('title', ''),
-            'frequency': series.get('frequency', ''),
-            'units': series.get('units', ''),
-            'observation_start': series.get('observation_start', ''),
-            'observation_end': series.get('observation_end', ''),
-            'last_updated': series.get('last_updated', ''),
-            'popularity': series.get('popularity', 0)
-        })
+    if collected_entries:
+        series_index.extend(collected_entries)
     
-    # Sort by popularity (descending)
-    series_index.sort(key=lambda x: x.get('popularity', 0), reverse=True)
+    # Sort by popularity (descending); the field may be present but null
+    series_index.sort(key=lambda x: x.get('popularity') or 0, reverse=True)
     
     # Store the index
     store_data_in_s3(
@@ -469,6 +1179,46 @@ def create_series_index(
     
     LOGGER.info(f"Created index with {len(series_index)} important series")
 
+def replace_indexed_run(
+    bucket: str,
+    prefix: str,
+    run_id: str
+) -> None:
+    """
+    Record the run the series index was just built from and delete the files
+    of the run it replaces, so runs/ only keeps the indexed run.
+    
+    Runs that never finish are not known here; see the lifecycle rule in the
+    S3 configuration notes.
+    
+    Args:
+        bucket: S3 bucket name
+        prefix: S3 prefix the index is written under
+        run_id: ID of the run the index was built from
+    """
+    marker_key = f"{prefix}/indexed_run.json"
+    
+    try:
+        previous_run_id = read_data_from_s3(bucket, marker_key).get('run_id')
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') != 'NoSuchKey':
+            raise
+        previous_run_id = None
+    
+    # Move the marker first so it never points at a deleted run
+    store_data_in_s3(
+        bucket=bucket,
+        key=marker_key,
+        data={
+            'run_id': run_id,
+            'last_updated': datetime.now(timezone.utc).isoformat()
+        }
+    )
+    
+    if previous_run_id and previous_run_id != run_id:
+        deleted = delete_objects(bucket, f"{prefix}/runs/{previous_run_id}/")
+        LOGGER.info(f"Deleted {deleted} files of previously indexed run {previous_run_id}")
+
 def lambda_handler(event, context):
     """
     AWS Lambda handler function.
@@ -487,6 +1237,24 @@ def lambda_handler(event, context):
     LOGGER.info("Lambda execution completed")
     return result
 
+def coordinator_handler(event, context):
+    """
+    AWS Lambda handler for the fan-out coordinator.
+    
+    Args:
+        event: Lambda event object
+        context: Lambda context object
+        
+    Returns:
+        Lambda response object
+    """
+    LOGGER.info(f"Starting fan-out coordinator with event: {json.dumps(event)}")
+    
+    result = coordinate_fred_series_fetch(event, context)
+    
+    LOGGER.info("Fan-out coordinator completed")
+    return result
+
 if __name__ == '__main__':
     """
     Local execution entry point for testing.
@@ -518,18 +1286,17 @@ if __name__ == '__main__':
     event = {}
     if resume:
         try:
-            s3_client = boto3.client('s3')
             checkpoint_key = f"{os.environ.get('S3_PREFIX')}/checkpoint.json"
             
             LOGGER.info(f"Attempting to load checkpoint from "
                         f"s3://{os.environ.get('S3_BUCKET_NAME')}/{checkpoint_key}")
             
-            response = s3_client.get_object(
+            response = S3_CLIENT.get_object(
                 Bucket=os.environ.get('S3_BUCKET_NAME'),
                 Key=checkpoint_key
             )
             
-            checkpoint = json.loads(response['Body'].read().decode('utf-8'))
+            checkpoint = parse_json(response['Body'].read())
             event = {'checkpoint': checkpoint}
             
             LOGGER.info(f"Loaded checkpoint: {json.dumps(checkpoint, indent=2)}")